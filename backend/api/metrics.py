@@ -1,14 +1,103 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from psycopg2.extras import RealDictCursor
+from typing import List
+import hashlib
+import json
 import psycopg2
 from config import DB_CONFIG
 
 
 router = APIRouter()
 
+# Buckets per hour of window, used to cap the number of points per series
+BUCKETS = {"minute": 60, "hour": 1, "day": 1 / 24}
+MAX_POINTS_PER_SERIES = 1500
+MAX_BULK_FUNCTIONS = 500
+
 def get_db():
     return psycopg2.connect(**DB_CONFIG)
 
+def etag_matches(if_none_match, etag):
+    """ Weak comparison of an If-None-Match header against our ETag. """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+
+@router.get("/metrics/")
+def get_bulk_metrics(
+    request: Request,
+    functions: List[str] = Query(...),
+    bucket: str = "hour",
+    hours: int = Query(24, ge=1, le=24 * 30),
+):
+    """Pre-aggregated time series for many functions in a single response.
+
+    Responses carry an ETag derived from a cheap summary of the matching rows;
+    clients that send it back in If-None-Match get a 304 without the
+    aggregation being run.
+    """
+    if bucket not in BUCKETS:
+        raise HTTPException(status_code=400, detail=f"bucket must be one of {sorted(BUCKETS)}")
+    if hours * BUCKETS[bucket] > MAX_POINTS_PER_SERIES:
+        raise HTTPException(status_code=400, detail=f"Window too large for '{bucket}' buckets (max {MAX_POINTS_PER_SERIES} points per series)")
+    if len(functions) > MAX_BULK_FUNCTIONS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_FUNCTIONS} functions per request")
+
+    # Window start is aligned to the bucket so the result only changes when
+    # rows are added or a bucket boundary passes, which the validator captures.
+    window = "created_at >= date_trunc(%s, NOW() - make_interval(hours => %s))"
+    try:
+        conn = get_db()
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute(f"""
+            SELECT date_trunc(%s, NOW()) AS current_bucket, COUNT(*) AS total, MAX(id) AS last_id
+            FROM metrics
+            WHERE function_name = ANY(%s) AND {window}
+        """, (bucket, list(functions), bucket, hours))
+        validator = cur.fetchone()
+        etag = '"' + hashlib.sha256(json.dumps(
+            jsonable_encoder({"functions": functions, "bucket": bucket, "hours": hours, **validator}),
+            sort_keys=True
+        ).encode("utf-8")).hexdigest() + '"'
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            cur.close()
+            conn.close()
+            return Response(status_code=304, headers={"ETag": etag})
+
+        cur.execute(f"""
+            SELECT
+                function_name,
+                date_trunc(%s, created_at) AS bucket,
+                AVG(response_time) AS avg_time,
+                AVG(cpu_percentage) AS avg_cpu,
+                AVG(memory_usage_mb) AS avg_mem,
+                COUNT(*) FILTER (WHERE success) AS success_count,
+                COUNT(*) FILTER (WHERE NOT success) AS failure_count
+            FROM metrics
+            WHERE function_name = ANY(%s) AND {window}
+            GROUP BY function_name, bucket
+            ORDER BY function_name, bucket
+        """, (bucket, list(functions), bucket, hours))
+        rows = cur.fetchall()
+        cur.close()
+        conn.close()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    series = {name: {"buckets": [], "avg_time": [], "avg_cpu": [], "avg_mem": [],
+                     "success_count": [], "failure_count": []} for name in functions}
+    for row in rows:
+        entry = series[row["function_name"]]
+        entry["buckets"].append(row["bucket"])
+        for key in ("avg_time", "avg_cpu", "avg_mem", "success_count", "failure_count"):
+            entry[key].append(row[key])
+
+    payload = jsonable_encoder({"bucket": bucket, "hours": hours, "series": series})
+    return JSONResponse(content=payload, headers={"ETag": etag})
+
 @router.get("/metrics/{function_name}")
 def get_metrics(function_name: str):
     try:
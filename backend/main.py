@@ -1,5 +1,6 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel
+from typing import Optional
 import docker
 import psycopg2
 import time
@@ -44,6 +45,25 @@ def create_table():
             code TEXT NOT NULL
         )
     """)
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS metrics (
+            id SERIAL PRIMARY KEY,
+            function_name TEXT NOT NULL,
+            runtime TEXT NOT NULL,
+            response_time FLOAT NOT NULL,
+            memory_usage_mb FLOAT NOT NULL,
+            cpu_percentage FLOAT NOT NULL,
+            success BOOLEAN NOT NULL,
+            created_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+    # Older databases created the metrics table without a timestamp; the bulk
+    # time-series endpoint buckets on it. Existing rows stay NULL rather than
+    # being backfilled with the migration time, which would pile the whole
+    # history into a single bucket.
+    cur.execute("ALTER TABLE metrics ADD COLUMN IF NOT EXISTS created_at TIMESTAMP")
+    cur.execute("ALTER TABLE metrics ALTER COLUMN created_at SET DEFAULT NOW()")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_metrics_function_time ON metrics (function_name, created_at)")
     conn.commit()
     cur.close()
     conn.close()
@@ -112,19 +132,40 @@ async def create_function(request: FunctionRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 @app.get("/functions/")
-async def list_functions():
-    """Retrieve the list of available functions."""
+async def list_functions(
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    search: Optional[str] = None,
+):
+    """Retrieve a page of available functions, ordered by name.
+
+    Pass the returned ``next_cursor`` back as ``cursor`` to fetch the next page.
+    """
+    conditions = []
+    params = []
+    if cursor:
+        conditions.append("name > %s")
+        params.append(cursor)
+    if search:
+        # Escape LIKE wildcards so "my_func" doesn't also match "myXfunc"
+        escaped = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        conditions.append("name ILIKE %s ESCAPE '\\'")
+        params.append(f"%{escaped}%")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
     conn = get_db_connection()
     cur = conn.cursor()
-    cur.execute("SELECT name FROM functions")
-    functions = cur.fetchall()
+    # Fetch one extra row to know whether another page exists
+    cur.execute(f"SELECT name FROM functions {where} ORDER BY name LIMIT %s", (*params, limit + 1))
+    functions = [f[0] for f in cur.fetchall()]
     cur.close()
     conn.close()
-    
-    if not functions:
+
+    if not functions and cursor is None and not search:
         raise HTTPException(status_code=404, detail="No functions available")
-    
-    return {"message": "Available functions", "data": [f[0] for f in functions]}
+
+    next_cursor = functions[limit - 1] if len(functions) > limit else None
+    return {"message": "Available functions", "data": functions[:limit], "next_cursor": next_cursor}
 
 import tarfile
 import io
@@ -2,6 +2,7 @@ import streamlit as st
 import requests
 from urllib.parse import quote
 import plotly.graph_objects as go
+import time
 
 BASE_URL = "http://localhost:8000"
 
@@ -75,10 +76,36 @@ from urllib.parse import quote  # for safe URL formatting
 
 st.header("📜 Available Functions")
 
+PAGE_SIZE = 20
+
+# Cursor of every page visited so far, so "Previous" can walk back
+if "fn_cursors" not in st.session_state:
+    st.session_state.fn_cursors = [None]
+
+def reset_function_pages():
+    st.session_state.fn_cursors = [None]
+
+# Paging runs in on_click callbacks so the rerun fetches the new page directly
+def previous_function_page():
+    st.session_state.fn_cursors.pop()
+
+def next_function_page(cursor):
+    st.session_state.fn_cursors.append(cursor)
+
+fn_search = st.text_input("🔎 Search Functions", key="fn_search", on_change=reset_function_pages)
+
+functions = []
+next_cursor = None
 try:
-    response = requests.get(f"{BASE_URL}/functions/")
+    response = requests.get(f"{BASE_URL}/functions/", params={
+        "cursor": st.session_state.fn_cursors[-1],
+        "limit": PAGE_SIZE,
+        "search": fn_search or None
+    })
     if response.ok:
-        functions = response.json().get("data", [])
+        body = response.json()
+        functions = body.get("data", [])
+        next_cursor = body.get("next_cursor")
         if functions:
             for fn in functions:
                 with st.expander(f"🔧 Manage Function: {fn}"):
@@ -108,13 +135,25 @@ try:
                                 st.success(f"✅ `{fn}` updated successfully!")
                             else:
                                 st.error(f"❌ Update failed: {res.json().get('detail')}")
+        elif len(st.session_state.fn_cursors) > 1:
+            # e.g. the last function on this page was just deleted
+            st.info("ℹ️ No more functions on this page.")
+        elif fn_search:
+            st.info(f"ℹ️ No functions matching `{fn_search}`.")
         else:
             st.info("ℹ️ No deployed functions yet.")
+    elif response.status_code == 404:
+        st.info("ℹ️ No deployed functions yet.")
     else:
         st.error("❌ Failed to fetch functions list.")
 except Exception as e:
     st.error(f"🚨 Error: {e}")
 
+pcol1, pcol2, pcol3 = st.columns([1, 1, 4])
+pcol1.button("⬅️ Previous", disabled=len(st.session_state.fn_cursors) == 1, on_click=previous_function_page)
+pcol2.button("➡️ Next", disabled=next_cursor is None, on_click=next_function_page, args=(next_cursor,))
+pcol3.caption(f"Page {len(st.session_state.fn_cursors)}")
+
 
 
 # --- Execute Function ---
@@ -204,3 +243,56 @@ if st.button("📊 Get Metrics"):
                 st.json(response.json())
         except Exception as e:
             st.error(f"🚨 Error fetching metrics: {e}")
+
+# --- Metrics Overview (current page of functions) ---
+st.header("📉 Metrics Overview")
+
+OVERVIEW_REFRESH_SEC = 30
+# Longest window per bucket, keeping each series within the backend's point cap
+OVERVIEW_MAX_HOURS = {"minute": 24, "hour": 168, "day": 168}
+
+ocol1, ocol2 = st.columns(2)
+with ocol1:
+    overview_bucket = st.selectbox("🪣 Bucket", ["hour", "minute", "day"])
+with ocol2:
+    overview_hours = st.slider("🕒 Window (hours)", 1, OVERVIEW_MAX_HOURS[overview_bucket], 24)
+
+if not functions:
+    st.info("ℹ️ No functions on this page to chart.")
+else:
+    overview_params = {"functions": functions, "bucket": overview_bucket, "hours": overview_hours}
+    # Only the latest response is kept. It is reused across reruns and only
+    # revalidated (with If-None-Match) once it is older than the refresh interval.
+    cache_key = (tuple(functions), overview_bucket, overview_hours)
+    cached = st.session_state.get("overview_cache")
+    if cached and cached["key"] != cache_key:
+        cached = None
+    try:
+        if not cached or time.time() - cached["fetched_at"] > OVERVIEW_REFRESH_SEC:
+            headers = {"If-None-Match": cached["etag"]} if cached and cached["etag"] else {}
+            response = requests.get(f"{BASE_URL}/metrics/", params=overview_params, headers=headers)
+            if response.status_code == 304:
+                cached["fetched_at"] = time.time()
+            elif response.ok:
+                cached = {
+                    "key": cache_key,
+                    "etag": response.headers.get("ETag"),
+                    "data": response.json(),
+                    "fetched_at": time.time()
+                }
+                st.session_state.overview_cache = cached
+            else:
+                st.error(f"❌ Failed to fetch metrics overview: {response.status_code}")
+
+        if cached:
+            time_fig = go.Figure()
+            for fn, series in cached["data"]["series"].items():
+                if series["buckets"]:
+                    time_fig.add_trace(go.Scatter(x=series["buckets"], y=series["avg_time"], mode="lines+markers", name=fn))
+            if time_fig.data:
+                time_fig.update_layout(title="⏱ Avg Response Time (s)", height=400)
+                st.plotly_chart(time_fig, use_container_width=True)
+            else:
+                st.info("ℹ️ No metrics recorded in this window.")
+    except Exception as e:
+        st.error(f"🚨 Error fetching metrics overview: {e}")